@@ -1,10 +1,22 @@
 import sys
+import warnings
+
+import numpy as np
 
 # Constants definition
 MIN_K = 1          # Minimum allowed number of clusters
 MIN_ITER = 1       # Minimum allowed iteration count
 MAX_ITER = 1000    # Maximum allowed iteration count
 DEFAULT_ITER = 400 # Default number of iterations if not specified
+ALGORITHMS = ("lloyd", "elkan")  # Supported kmeans_clustering algorithms
+INITS = ("first", "k-means++")   # Supported centroid initializations
+ELKAN_SLACK = 1e-9 # Relative margin keeping Elkan's bounds safe from rounding
+BLOCK_SIZE = 4096  # Vectors per distance tile, keeps a tile cache-resident
+MIN_CHUNK = 16384  # Minimum vectors per chunk when summing clusters in parallel
+MAX_CHUNKS = 64    # Upper bound on summation chunks, independent of the host
+NUMBA_MIN_WORK = 10000000  # N*K*D from which the Numba kernel beats NumPy
+
+JIT_KERNELS = {}   # Numba kernels, built on first use (None without Numba)
 
 def parse_command_line_args():
     """Parse and validate command line arguments.
@@ -57,196 +69,461 @@ def read_vectors(file_arg=None):
     Args:
         file_arg: filename or None for stdin
     Returns:
-        list: list of vectors or None on error
+        np.ndarray: (N, D) array of vectors or None on error
     """
-    vectors = []
-
     try:
         if file_arg:
             # Read from specified file
             with open(file_arg, 'r') as f:
-                lines = f.readlines()
+                vectors = parse_vectors(f)
         else:
             # Read from standard input
-            lines = sys.stdin.readlines()
-
-        # Process each line
-        for line in lines:
-            line = line.strip()
-            if line:
-                try:
-                    # Convert comma-separated values to float vector
-                    vector = list(map(float, line.split(',')))
-                    vectors.append(vector)
-                except ValueError:  # Handle conversion error
-                    print("An Error Has Occurred")
-                    return None
-
-    except Exception:  # Catch all file/IO errors
+            vectors = parse_vectors(sys.stdin)
+    except Exception:  # Catch all file/IO/parse errors
         print("An Error Has Occurred")
         return None
 
     # Check for empty input
-    if not vectors:
+    if vectors.size == 0:
         print("An Error Has Occurred")
         return None
 
     return vectors
 
-def validate_vector_dimensions(vectors):
-    """Verify all vectors have same dimensionality.
+def parse_vectors(lines):
+    """Parse comma-separated lines into a float array.
     Args:
-        vectors: list of vectors
+        lines: iterable of text lines
     Returns:
-        bool: True if valid, False otherwise
+        np.ndarray: (N, D) array of vectors (empty if there are no vectors)
+    Raises:
+        ValueError: on ragged rows or non-numeric values
     """
-    if not vectors:
-        print("An Error Has Occurred")
-        return False
-
-    # Get dimension of first vector
-    vector_dim = len(vectors[0])
-    for vector in vectors:
-        # Compare all vector lengths to first
-        if len(vector) != vector_dim:
-            print("An Error Has Occurred")
-            return False
-
-    return True
-
-def initialize_centroids(vectors, k):
-    """Initialize centroids using first k vectors.
+    with warnings.catch_warnings():
+        # Empty input only warns in loadtxt ("Empty input file" before NumPy 2,
+        # "input contained no data" after); read_vectors reports it instead
+        warnings.filterwarnings("ignore", category=UserWarning,
+                                message=".*([Ee]mpty input|input contained no data)")
+        # Skip lines that are empty after strip(), and treat '#' as data
+        return np.loadtxt((line for line in lines if line.strip()), delimiter=',',
+                          dtype=np.float64, ndmin=2, comments=None)
+
+def initialize_centroids(vectors, k, init="first", seed=None):
+    """Initialize centroids using first k vectors or k-means++ seeding.
     Args:
-        vectors: list of input vectors
+        vectors: (N, D) array of input vectors
         k: number of clusters
+        init: "first" (first k vectors) or "k-means++"
+        seed: random seed for k-means++ (optional)
     Returns:
         tuple: (centroids, k) or (None, None) on error
     """
+    # Reject unknown initializations instead of silently using the first k
+    if init not in INITS:
+        print("An Error Has Occurred")
+        return None, None
+
     # Validate k doesn't exceed number of vectors
     if k >= len(vectors):
         print("Incorrect number of clusters!")
         return None, None
 
-    # Select first k vectors as initial centroids
-    centroids = [vectors[i][:] for i in range(k)]
+    if init == "k-means++":
+        # Spread-out seeds, usually converge in fewer iterations
+        centroids = vectors[kmeans_plus_plus(vectors, k, seed)]
+    else:
+        # Select first k vectors as initial centroids (copy, not a view)
+        centroids = vectors[:k].copy()
     return centroids, k
 
-def euclidean_distance(point, centroid):
-    """Calculate Euclidean distance between point and centroid.
+def kmeans_plus_plus(vectors, k, seed=None):
+    """Pick k seed indices with k-means++ (D^2 weighted sampling).
+    Args:
+        vectors: (N, D) array of input vectors
+        k: number of clusters
+        seed: random seed (optional)
+    Returns:
+        list: indices of the chosen seed vectors
+    """
+    rng = np.random.default_rng(seed)
+    n = len(vectors)
+    # First seed uniformly at random
+    indices = [int(rng.integers(n))]
+    closest = squared_norms(vectors - vectors[indices[0]])
+
+    for _ in range(k - 1):
+        total = closest.sum()
+        # Next seed with probability proportional to squared distance to the
+        # nearest seed so far (uniform if every vector is already a seed)
+        probs = closest / total if total > 0 else None
+        indices.append(int(rng.choice(n, p=probs)))
+        np.minimum(closest, squared_norms(vectors - vectors[indices[-1]]), out=closest)
+
+    return indices
+
+def squared_norms(vectors):
+    """Calculate squared Euclidean norm of each row.
     Args:
-        point: data point vector
-        centroid: cluster center vector
+        vectors: (N, D) array of vectors
     Returns:
-        float: distance value
+        np.ndarray: (N,) squared norms
     """
-    return sum((point[i] - centroid[i]) ** 2 for i in range(len(point))) ** 0.5
+    return np.einsum('ij,ij->i', vectors, vectors)
 
-def assign_clusters(vectors, centroids):
+def assign_clusters(vectors, centroids, vector_norms=None):
     """Assign vectors to nearest centroids.
     Args:
-        vectors: list of input vectors
+        vectors: (N, D) array of input vectors
+        centroids: (K, D) array of current cluster centers
+        vector_norms: precomputed squared norms of vectors (optional)
+    Returns:
+        np.ndarray: (N,) int32 index of the closest centroid for each vector
+    """
+    if vector_norms is None:
+        vector_norms = squared_norms(vectors)
+    centroid_norms = squared_norms(centroids)
+    # Column-major (D, K) operand for the matrix product, made once per call
+    centroids_t = np.asfortranarray(centroids.T)
+    labels = np.empty(len(vectors), dtype=np.int32)
+
+    # Process vectors in tiles so each block and the centroids stay in cache
+    for start in range(0, len(vectors), BLOCK_SIZE):
+        stop = start + BLOCK_SIZE
+        block = vectors[start:stop]
+        # Squared distances via |x|^2 + |c|^2 - 2 x.c, shape (block, K)
+        distances = vector_norms[start:stop, None] + centroid_norms[None, :] - 2.0 * (block @ centroids_t)
+        # Closest centroid index per vector
+        labels[start:stop] = distances.argmin(axis=1)
+
+    return labels
+
+def update_centroids(vectors, labels, centroids, eps):
+    """Calculate new centroids and check convergence.
+    Args:
+        vectors: (N, D) array of input vectors
+        labels: (N,) int32 cluster index of each vector
         centroids: current cluster centers
+        eps: convergence threshold
     Returns:
-        list: clusters (list of vectors per cluster)
+        tuple: (new_centroids, convergence_flag)
     """
     k = len(centroids)
-    # Initialize empty clusters
-    clusters = [[] for _ in range(k)]
-
-    for vector in vectors:
-        # Calculate distances to all centroids
-        distances = [euclidean_distance(vector, centroid) for centroid in centroids]
-        # Find closest centroid index
-        closest_centroid = distances.index(min(distances))
-        # Add vector to corresponding cluster
-        clusters[closest_centroid].append(vector)
+    # Sum vectors per cluster in a single scatter-add
+    sums = np.zeros_like(centroids)
+    np.add.at(sums, labels, vectors)
+    counts = np.bincount(labels, minlength=k)
 
-    return clusters
+    return finalize_centroids(sums, counts, centroids, eps)
 
-def update_centroids(clusters, centroids, eps):
-    """Calculate new centroids and check convergence.
+def finalize_centroids(sums, counts, centroids, eps):
+    """Turn per-cluster sums into new centroids and check convergence.
     Args:
-        clusters: current cluster assignments
+        sums: (K, D) sum of the vectors assigned to each cluster
+        counts: (K,) number of vectors assigned to each cluster
         centroids: current cluster centers
         eps: convergence threshold
     Returns:
         tuple: (new_centroids, convergence_flag)
     """
-    flag = True  # Convergence flag (assume converged)
-    k = len(centroids)
-    new_centroids = []
-
-    for j in range(k):
-        if clusters[j]:  # Cluster has vectors
-            dim = len(clusters[j][0])
-            # Initialize new centroid vector
-            new_centroid = [0] * dim
-            # Sum all vectors in cluster
-            for point in clusters[j]:
-                for i in range(dim):
-                    new_centroid[i] += point[i]
-            # Calculate mean (centroid position)
-            for i in range(dim):
-                new_centroid[i] /= len(clusters[j])
-
-            # Check if centroid moved significantly
-            if euclidean_distance(centroids[j], new_centroid) > eps:
-                flag = False  # Not converged
-
-            new_centroids.append(new_centroid)
-        else:  # Empty cluster - keep old centroid
-            new_centroids.append(centroids[j][:])
+    new_centroids = sums.copy()
+    # Calculate mean (centroid position) for non-empty clusters
+    nonempty = counts > 0
+    new_centroids[nonempty] /= counts[nonempty, None]
+    # Empty cluster - keep old centroid
+    new_centroids[~nonempty] = centroids[~nonempty]
+
+    # Converged if no centroid moved significantly (squared, no sqrt needed)
+    flag = bool(squared_norms(new_centroids - centroids).max() <= eps * eps)
 
     return new_centroids, flag
 
-def print_results(clusters, centroids, verbose=True):
+def build_lloyd_step(numba):
+    """Build the JIT compiled Lloyd kernel.
+    Args:
+        numba: the imported numba module
+    Returns:
+        function: lloyd_step
+    """
+    @numba.njit(inline='always', fastmath=True)
+    def squared_distance(vectors, i, centroids, j):
+        """Squared Euclidean distance between vectors[i] and centroids[j].
+        Args:
+            vectors: (N, D) array of input vectors
+            i: vector row index
+            centroids: (K, D) array of cluster centers
+            j: centroid row index
+        Returns:
+            float: squared distance
+        """
+        # Accumulate in the input's own float type, float32 stays float32
+        dist = vectors.dtype.type(0)
+        for d in range(vectors.shape[1]):
+            t = vectors[i, d] - centroids[j, d]
+            dist += t * t
+        return dist
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def lloyd_step(vectors, centroids, labels, new_centroids, counts, eps, chunks):
+        """Run a full Lloyd iteration in compiled code (JIT compiled).
+        Distances are reduced to the running minimum as they are computed,
+        so no (N, K) distance matrix is ever stored.
+        Args:
+            vectors: (N, D) array of input vectors
+            centroids: (K, D) array of current cluster centers
+            labels: (N,) int32 output, closest centroid index per vector
+            new_centroids: (K, D) zeroed output, updated cluster centers
+            counts: (K,) zeroed output, number of vectors per cluster
+            eps: convergence threshold
+            chunks: number of vector chunks summed independently
+        Returns:
+            bool: True if no centroid moved more than eps
+        """
+        n, dim = vectors.shape
+        k = centroids.shape[0]
+
+        # Nearest centroid per vector, points split across threads
+        for i in numba.prange(n):
+            best = np.inf
+            best_j = 0
+            for j in range(k):
+                dist = squared_distance(vectors, i, centroids, j)
+                if dist < best:
+                    best = dist
+                    best_j = j
+            labels[i] = best_j
+
+        # Contiguous chunks of vectors, each with a private accumulator, so
+        # cluster sums are accumulated in parallel without races
+        size = (n + chunks - 1) // chunks
+        partial_sums = np.zeros((chunks, k, dim))
+        partial_counts = np.zeros((chunks, k), dtype=np.int64)
+        for c in numba.prange(chunks):
+            for i in range(c * size, min(n, (c + 1) * size)):
+                j = labels[i]
+                partial_counts[c, j] += 1
+                for d in range(dim):
+                    partial_sums[c, j, d] += vectors[i, d]
+
+        # Reduce the per-chunk buffers in chunk order
+        for c in range(chunks):
+            for j in range(k):
+                counts[j] += partial_counts[c, j]
+                for d in range(dim):
+                    new_centroids[j, d] += partial_sums[c, j, d]
+
+        converged = True
+        eps2 = eps * eps
+        for j in range(k):
+            if counts[j] > 0:
+                # Calculate mean (centroid position)
+                for d in range(dim):
+                    new_centroids[j, d] /= counts[j]
+            else:
+                # Empty cluster - keep old centroid
+                for d in range(dim):
+                    new_centroids[j, d] = centroids[j, d]
+            # Check if centroid moved significantly (squared, no sqrt needed)
+            if squared_distance(new_centroids, j, centroids, j) > eps2:
+                converged = False
+
+        return converged
+
+    return lloyd_step
+
+def get_lloyd_step():
+    """Import Numba and build the Lloyd kernel on first use.
+    Returns:
+        function: JIT compiled lloyd_step, or None if Numba is not installed
+    """
+    if 'lloyd_step' not in JIT_KERNELS:
+        try:
+            import numba  # Optional, only loaded for large workloads
+        except ImportError:
+            JIT_KERNELS['lloyd_step'] = None
+        else:
+            JIT_KERNELS['lloyd_step'] = build_lloyd_step(numba)
+    return JIT_KERNELS['lloyd_step']
+
+def kmeans_step(vectors, centroids, vector_norms, eps):
+    """Run a single Lloyd iteration (assignment + update).
+    Args:
+        vectors: (N, D) array of input vectors
+        centroids: (K, D) array of current cluster centers
+        vector_norms: precomputed squared norms of vectors
+        eps: convergence threshold
+    Returns:
+        tuple: (labels, new_centroids, convergence_flag)
+    """
+    lloyd_step = None
+    # Importing Numba and loading the compiled kernel takes ~0.5s,
+    # which only pays off on large inputs
+    if vectors.size * len(centroids) >= NUMBA_MIN_WORK:
+        lloyd_step = get_lloyd_step()
+
+    if lloyd_step is None:
+        labels = assign_clusters(vectors, centroids, vector_norms)
+        new_centroids, flag = update_centroids(vectors, labels, centroids, eps)
+        return labels, new_centroids, flag
+
+    labels = np.empty(len(vectors), dtype=np.int32)
+    new_centroids = np.zeros_like(centroids)
+    counts = np.zeros(len(centroids), dtype=np.int64)
+    # Chunk count depends on N only, so the summation order (and the output)
+    # is the same on every host; small inputs are summed in one chunk, in the
+    # same order as the C version
+    chunks = max(1, min(MAX_CHUNKS, len(vectors) // MIN_CHUNK))
+    flag = lloyd_step(vectors, centroids, labels, new_centroids, counts, eps, chunks)
+    return labels, new_centroids, flag
+
+def centroid_distances(vectors, centroid):
+    """Calculate exact Euclidean distance from every vector to one centroid.
+    Args:
+        vectors: (N, D) array of vectors
+        centroid: (D,) cluster center
+    Returns:
+        np.ndarray: (N,) distances
+    """
+    return np.sqrt(squared_norms(vectors - centroid))
+
+def elkan_assign(vectors, centroids, labels, upper, lower):
+    """Reassign vectors using Elkan's triangle-inequality bounds.
+    Only distances that the bounds cannot rule out are computed.
+    Args:
+        vectors: (N, D) array of input vectors
+        centroids: (K, D) array of current cluster centers
+        labels: (N,) int32 cluster index of each vector, updated in place
+        upper: (N,) upper bound on distance to own centroid, updated in place
+        lower: (N, K) lower bounds on distance to each centroid, updated in place
+    """
+    k = len(centroids)
+    # Pairwise centroid distances and half distance to the nearest other centroid
+    diff = centroids[:, None, :] - centroids[None, :, :]
+    between = np.sqrt(np.einsum('ijk,ijk->ij', diff, diff))
+    half_nearest = 0.5 * np.where(np.eye(k, dtype=bool), np.inf, between).min(axis=1)
+
+    # Vectors closer to their centroid than half the gap to any other keep it;
+    # bounds are shrunk by ELKAN_SLACK since shifting them accumulates rounding,
+    # and >= keeps exact ties active, they may belong to a lower index
+    active = np.flatnonzero(upper >= half_nearest[labels] * (1 - ELKAN_SLACK))
+    # Tighten the upper bound of the remaining vectors to the exact distance
+    exact = np.sqrt(squared_norms(vectors[active] - centroids[labels[active]]))
+    upper[active] = exact
+    lower[active, labels[active]] = exact
+
+    # Centroids the bounds cannot rule out, judged against the tightened bound;
+    # later tightening only makes this a superset, which is still exact
+    own = labels[active]
+    bound = np.maximum(lower[active], 0.5 * between[own])
+    candidates = upper[active, None] >= bound * (1 - ELKAN_SLACK)
+    candidates[np.arange(len(active)), own] = False
+
+    for j in np.flatnonzero(candidates.any(axis=0)):
+        idx = active[candidates[:, j]]
+        dist = centroid_distances(vectors[idx], centroids[j])
+        lower[idx, j] = dist
+        # Move vectors that are closer to centroid j, or tied with it while j
+        # has the lower index (the same tie-break as argmin)
+        closer = (dist < upper[idx]) | ((dist == upper[idx]) & (j < labels[idx]))
+        labels[idx[closer]] = j
+        upper[idx[closer]] = dist[closer]
+
+def elkan_clustering(vectors, centroids, max_iter, eps):
+    """Run k-means with Elkan's bounds until convergence or max_iter.
+    Args:
+        vectors: (N, D) array of input vectors
+        centroids: (K, D) array of initial cluster centers
+        max_iter: maximum iterations
+        eps: convergence threshold
+    Returns:
+        tuple: (labels, centroids)
+    """
+    # First pass computes every distance, which initialises the bounds exactly
+    lower = np.empty((len(vectors), len(centroids)))
+    for j in range(len(centroids)):
+        lower[:, j] = centroid_distances(vectors, centroids[j])
+    labels = lower.argmin(axis=1).astype(np.int32)
+    upper = lower[np.arange(len(vectors)), labels]
+
+    curr_iter = 0
+    converged = False
+
+    while not converged and curr_iter < max_iter:
+        curr_iter += 1
+        if curr_iter > 1:
+            # Loosen the bounds by how far each centroid moved, then reassign
+            upper += shifts[labels]
+            lower -= shifts
+            np.maximum(lower, 0.0, out=lower)
+            elkan_assign(vectors, centroids, labels, upper, lower)
+        # Update centroids and check convergence
+        new_centroids, converged = update_centroids(vectors, labels, centroids, eps)
+        shifts = np.sqrt(squared_norms(new_centroids - centroids))
+        centroids = new_centroids
+
+    return labels, centroids
+
+def print_results(labels, centroids, verbose=True):
     """Print final centroids with 4 decimal precision.
     Args:
-        clusters: final cluster assignments
+        labels: final cluster index of each vector
         centroids: final cluster centers
         verbose: unused in this implementation
     """
-    for centroid in centroids:
-        # Format each coordinate to 4 decimal places
-        formatted_centroid = [f"{x:.4f}" for x in centroid]
-        # Join coordinates with commas
-        print(','.join(formatted_centroid))
+    # Format each coordinate to 4 decimal places, comma separated, in one pass
+    np.savetxt(sys.stdout, centroids, fmt='%.4f', delimiter=',')
 
-def kmeans_clustering(k, max_iter, vectors, eps=0.001, verbose=True):
+def kmeans_clustering(k, max_iter, vectors, eps=0.001, verbose=True, algorithm="lloyd",
+                      init="first", seed=None, dtype=np.float64):
     """Main k-means clustering algorithm.
     Args:
         k: number of clusters
         max_iter: maximum iterations
-        vectors: input data
+        vectors: input data, (N, D) array or list of vectors
         eps: convergence threshold
         verbose: unused
+        algorithm: "lloyd" (full distance matrix) or "elkan" (bounded)
+        init: "first" (first k vectors) or "k-means++" seeding
+        seed: random seed for k-means++ (optional)
+        dtype: float type used for the computation; np.float32 halves memory
+            traffic at the cost of output that may differ in the last digit
+            (API only, the command line always uses np.float64)
     Returns:
-        clusters or None on error
+        labels (cluster index per vector) or None on error
     """
-    # Validate vector dimensions
-    if not validate_vector_dimensions(vectors):
+    # Reject unknown algorithms instead of silently running Lloyd
+    if algorithm not in ALGORITHMS:
+        print("An Error Has Occurred")
         return None
 
+    # Convert the input once (no copy if it already matches), centroids and
+    # distances then follow its dtype
+    vectors = np.asarray(vectors, dtype=dtype)
+
     # Initialize centroids
-    centroids, k = initialize_centroids(vectors, k)
+    centroids, k = initialize_centroids(vectors, k, init, seed)
     if centroids is None:
         return None
 
+    # Prune distance computations with Elkan's triangle-inequality bounds
+    if algorithm == "elkan":
+        labels, centroids = elkan_clustering(vectors, centroids, max_iter, eps)
+        print_results(labels, centroids, verbose)
+        return labels
+
     curr_iter = 0
     converged = False
+    # Squared norms of the input never change, compute them once
+    vector_norms = squared_norms(vectors)
 
     # Main k-means loop
     while not converged and curr_iter < max_iter:
         curr_iter += 1
-        # Assign vectors to clusters
-        clusters = assign_clusters(vectors, centroids)
-        # Update centroids and check convergence
-        new_centroids, converged = update_centroids(clusters, centroids, eps)
-        centroids = new_centroids
+        # Assign vectors to clusters, update centroids and check convergence
+        labels, centroids, converged = kmeans_step(vectors, centroids, vector_norms, eps)
 
     # Output final centroids
-    print_results(clusters, centroids, verbose)
-    return clusters
+    print_results(labels, centroids, verbose)
+    return labels
 
 def main():
     """Program entry point."""
@@ -261,8 +538,8 @@ def main():
         return 1
 
     # Run k-means algorithm
-    clusters = kmeans_clustering(k, max_iter, vectors)
-    if clusters is None:
+    labels = kmeans_clustering(k, max_iter, vectors)
+    if labels is None:
         return 1
 
     return 0  # Success exit code
@@ -45,4 +45,7 @@ testKmeans "" 5_invalid general_error
 testKmeans "a 2" 5_invalid general_error
 testKmeans "2 a" 5_invalid general_error
 testKmeans "2 2 3" 5_invalid general_error
+
+echo "Running Python API checks: tests/test_kmeans.py"
+python3 tests/test_kmeans.py && echo -e "${GREEN}Test Passed.${RESET}" || echo -e "${RED}python API TEST FAILED!!!${RESET}"
 popd
\ No newline at end of file
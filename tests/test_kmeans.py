@@ -0,0 +1,198 @@
+"""Checks for kmeans.py options that the command line does not reach.
+
+Run directly (python3 tests/test_kmeans.py) or with pytest.
+"""
+import contextlib
+import io
+import sys
+import unittest
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+TESTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(TESTS_DIR.parent / "111111111_111111111_assignment1"))
+import kmeans  # noqa: E402
+
+
+def make_blobs(seed, n=400, dim=4, blobs=6):
+    """Gaussian blobs around random centers, like tester-2.py generates."""
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-20, 20, size=(blobs, dim))
+    return centers[rng.integers(blobs, size=n)] + rng.normal(size=(n, dim))
+
+
+@contextlib.contextmanager
+def patched(**constants):
+    """Temporarily override kmeans module constants, e.g. NUMBA_MIN_WORK."""
+    saved = {name: getattr(kmeans, name) for name in constants}
+    for name, value in constants.items():
+        setattr(kmeans, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(kmeans, name, value)
+
+
+def require_numba():
+    """Skip the calling test, visibly, when Numba is not installed."""
+    if kmeans.get_lloyd_step() is not None:
+        return
+    reason = "Numba is not installed"
+    if "pytest" in sys.modules:
+        import pytest
+        pytest.skip(reason)
+    raise unittest.SkipTest(reason)
+
+
+def run_quiet(*args, **kwargs):
+    """Run kmeans_clustering and return (labels, printed output)."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        labels = kmeans.kmeans_clustering(*args, **kwargs)
+    return labels, out.getvalue()
+
+
+def test_elkan_matches_lloyd():
+    for seed in range(10):
+        vectors = make_blobs(seed)
+        for k in (3, 7, 20):
+            lloyd_labels, lloyd_out = run_quiet(k, 300, vectors)
+            elkan_labels, elkan_out = run_quiet(k, 300, vectors, algorithm="elkan")
+            assert np.array_equal(lloyd_labels, elkan_labels), (seed, k)
+            assert lloyd_out == elkan_out, (seed, k)
+
+
+def test_elkan_breaks_ties_like_lloyd():
+    # Integer grids and duplicated vectors give exactly tied distances, which
+    # must go to the lowest centroid index as in Lloyd and the C version
+    cases = [(np.random.default_rng(79).integers(0, 4, (30, 4)).astype(float), 13)]
+    for seed in range(5):
+        grid = np.random.default_rng(seed).integers(0, 4, (40, 3)).astype(float)
+        cases += [(grid, 4), (grid, 9), (grid, 15)]
+    duplicated = np.repeat(make_blobs(4, n=100), 2, axis=0)
+    cases += [(duplicated, 7), (duplicated, 20)]
+
+    for vectors, k in cases:
+        lloyd_labels, lloyd_out = run_quiet(k, 300, vectors)
+        elkan_labels, elkan_out = run_quiet(k, 300, vectors, algorithm="elkan")
+        assert np.array_equal(lloyd_labels, elkan_labels), k
+        assert lloyd_out == elkan_out, k
+
+
+def test_unknown_algorithm_is_an_error():
+    labels, out = run_quiet(3, 100, make_blobs(0), algorithm="elkn")
+    assert labels is None
+    assert out == "An Error Has Occurred\n"
+
+
+def test_kmeans_plus_plus_is_seeded():
+    vectors = make_blobs(1)
+    first = kmeans.kmeans_plus_plus(vectors, 10, seed=42)
+    assert first == kmeans.kmeans_plus_plus(vectors, 10, seed=42)
+    assert first != kmeans.kmeans_plus_plus(vectors, 10, seed=43)
+
+
+def test_kmeans_plus_plus_picks_distinct_vectors():
+    # Distinct vectors always leave a positive D^2 total until all are picked
+    for seed in range(20):
+        vectors = make_blobs(seed, n=30)
+        indices = kmeans.kmeans_plus_plus(vectors, 29, seed=seed)
+        assert len(set(indices)) == len(indices), seed
+
+
+def test_kmeans_plus_plus_end_to_end():
+    labels, out = run_quiet(6, 300, make_blobs(2), init="k-means++", seed=0)
+    assert labels is not None
+    assert len(out.splitlines()) == 6
+
+
+def test_list_input_is_accepted():
+    vectors = make_blobs(5, n=60)
+    labels, out = run_quiet(4, 100, vectors)
+    list_labels, list_out = run_quiet(4, 100, vectors.tolist())
+    assert np.array_equal(list_labels, labels)
+    assert list_out == out
+
+
+def test_empty_input_does_not_warn():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert kmeans.parse_vectors(["", "  \n"]).size == 0
+
+
+def test_unknown_init_is_an_error():
+    labels, out = run_quiet(3, 100, make_blobs(0), init="kmeans++")
+    assert labels is None
+    assert out == "An Error Has Occurred\n"
+
+
+def run_float32(min_work):
+    """Cluster blobs in float32 with the given Numba work threshold."""
+    with patched(NUMBA_MIN_WORK=min_work):
+        vectors = make_blobs(3, n=2000)
+        centroids = vectors[:6].astype(np.float32)
+        labels, new_centroids, _ = kmeans.kmeans_step(
+            vectors.astype(np.float32), centroids,
+            kmeans.squared_norms(vectors.astype(np.float32)), 0.001)
+        assert new_centroids.dtype == np.float32
+        # Compare the whole run against float64 on well separated blobs
+        labels32, out32 = run_quiet(6, 300, vectors, dtype=np.float32)
+        labels64, out64 = run_quiet(6, 300, vectors)
+        assert np.array_equal(labels32, labels64)
+        got = np.loadtxt(io.StringIO(out32), delimiter=',')
+        expected = np.loadtxt(io.StringIO(out64), delimiter=',')
+        assert np.allclose(got, expected, atol=1e-3)
+        return labels
+
+
+def test_float32_numpy_path():
+    run_float32(min_work=float("inf"))
+
+
+def test_float32_numba_path():
+    require_numba()
+    # Both paths must agree on the float32 assignment
+    assert np.array_equal(run_float32(min_work=0), run_float32(min_work=float("inf")))
+
+
+def test_numba_chunked_sums_match_numpy():
+    require_numba()
+    vectors = make_blobs(4, n=5000, dim=5, blobs=8)
+    with patched(NUMBA_MIN_WORK=float("inf")):
+        expected = run_quiet(8, 300, vectors)
+    # 5000 vectors in chunks of at least 700 gives 7 partial sums per cluster
+    for min_chunk in (700, 1000, len(vectors)):
+        with patched(NUMBA_MIN_WORK=0, MIN_CHUNK=min_chunk):
+            labels, out = run_quiet(8, 300, vectors)
+        assert np.array_equal(labels, expected[0])
+        assert out == expected[1], f"MIN_CHUNK={min_chunk}"
+
+
+
+def test_numba_path_matches_golden_outputs():
+    require_numba()
+    # (k, max_iter, input, expected output), as listed in test_readme.txt
+    cases = [(3, 600, "input_1.txt", "output_1.txt"),
+             (7, kmeans.DEFAULT_ITER, "input_2.txt", "output_2.txt"),
+             (15, 300, "input_3.txt", "output_3.txt"),
+             (2, 2, "input_4.txt", "output_4__2_2.txt"),
+             (7, 999, "input_4.txt", "output_4__7_999.txt")]
+    with patched(NUMBA_MIN_WORK=0):
+        for k, max_iter, input_name, output_name in cases:
+            vectors = kmeans.read_vectors(str(TESTS_DIR / input_name))
+            _, out = run_quiet(k, max_iter, vectors)
+            assert out == (TESTS_DIR / output_name).read_text(), output_name
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            try:
+                test()
+            except unittest.SkipTest as skip:
+                print(f"{name}: skipped ({skip})")
+            else:
+                print(f"{name}: passed")